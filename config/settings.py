@@ -1,8 +1,36 @@
-from pydantic_settings import BaseSettings
-from typing import List
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, Set
 import os
 
-class ScrapingSettings(BaseSettings):
+ENV_FILE = ".env"
+
+_TRUE_VALUES = {"1", "true", "yes", "on", "y", "t"}
+_FALSE_VALUES = {"0", "false", "no", "off", "n", "f", ""}
+
+def _read_env_file(path: str) -> Dict[str, str]:
+    """Read KEY=VALUE pairs from an optional .env file"""
+    if not os.path.isfile(path):
+        return {}
+    from dotenv import dotenv_values
+    return {key: value for key, value in dotenv_values(path).items() if value is not None}
+
+def _coerce(name: str, value: str, field_type: type) -> Any:
+    """Convert an environment string to the field's declared type, naming the field on bad input"""
+    if field_type is bool:
+        flag = value.strip().lower()
+        if flag in _TRUE_VALUES:
+            return True
+        if flag in _FALSE_VALUES:
+            return False
+        raise ValueError(f"{name}={value!r} is not a boolean (use true/false, yes/no, on/off or 1/0)")
+    try:
+        return field_type(value)
+    except ValueError as e:
+        raise ValueError(f"{name}={value!r} is not a valid {field_type.__name__}") from e
+
+@dataclass(slots=True)
+class ScrapingSettings:
     # Scraping Layer Specifications from Presentation
     
     # Product Details to Extract
@@ -18,6 +46,7 @@ class ScrapingSettings(BaseSettings):
     MAX_PAGES_TO_SCRAPE: int = 20
     COLLECT_REVIEWER_METADATA: bool = True
     COLLECT_VERIFIED_STATUS: bool = True
+    REVIEW_FETCH_WORKERS: int = 5
     
     # Anti-Bot Measures (as per presentation challenges)
     USE_UNDETECTED_CHROME: bool = True
@@ -34,6 +63,10 @@ class ScrapingSettings(BaseSettings):
     # Browser Settings
     HEADLESS: bool = True
     WINDOW_SIZE: str = "1920,1080"
+    BLOCK_PAGE_RESOURCES: bool = True
+    DRIVER_POOL_SIZE: int = 2
+    MAX_USES_PER_DRIVER: int = 50
+    DRIVER_ACQUIRE_TIMEOUT: float = 120.0
     
     # File Paths
     DATA_DIR: str = "data"
@@ -41,10 +74,51 @@ class ScrapingSettings(BaseSettings):
     PROCESSED_DATA_DIR: str = "data/processed"
     LOG_DIR: str = "logs"
     
-    class Config:
-        env_file = ".env"
+    def __post_init__(self):
+        # Environment variables win over .env, which wins over the defaults above;
+        # names match case-insensitively (headless=false sets HEADLESS)
+        overrides = {
+            name.upper(): value
+            for source in (_read_env_file(ENV_FILE), os.environ)
+            for name, value in source.items()
+        }
+        for field in fields(self):
+            if field.name in overrides:
+                setattr(self, field.name, _coerce(field.name, overrides[field.name], field.type))
+
+# Directories already ensured by this process
+_created_dirs: Set[str] = set()
+
+def ensure_directories(config: ScrapingSettings):
+    """Create data/log directories, skipping ones already known to exist"""
+    wanted = [
+        directory
+        for directory in [config.DATA_DIR, config.RAW_DATA_DIR, config.PROCESSED_DATA_DIR, config.LOG_DIR]
+        if directory not in _created_dirs
+    ]
+    if not wanted:
+        return
+    
+    # One directory listing per parent instead of a stat/mkdir per path
+    existing: Set[str] = set()
+    parents = {os.path.dirname(os.path.normpath(directory)) or "." for directory in wanted}
+    for parent in parents:
+        try:
+            with os.scandir(parent) as entries:
+                existing.update(os.path.normpath(entry.path) for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            pass
+    
+    for directory in wanted:
+        if os.path.normpath(directory) not in existing:
+            os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+@lru_cache(maxsize=1)
+def get_settings() -> ScrapingSettings:
+    """Build settings once per process (reads .env a single time)"""
+    config = ScrapingSettings()
+    ensure_directories(config)
+    return config
 
-# Create directories
-settings = ScrapingSettings()
-for directory in [settings.DATA_DIR, settings.RAW_DATA_DIR, settings.PROCESSED_DATA_DIR, settings.LOG_DIR]:
-    os.makedirs(directory, exist_ok=True)
+settings = get_settings()
@@ -9,15 +9,42 @@ Based on presentation specifications:
 """
 
 import sys
-import argparse
-from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import List
+from urllib.parse import urlsplit
 
-from scraper.amazon_scraper import AmazonScraper
-from scraper.utils import save_to_json, save_reviews_to_csv, generate_filename, print_scraping_summary
 from config.settings import settings
 
+# Scraper, loguru and output helpers are imported lazily so `--help` and
+# argument errors don't pay for selenium/undetected-chromedriver imports
+
+# Flags understood by the fast-path argument parser
+_SIMPLE_FLAGS = {"--no-save", "--headless"}
+
+# Amazon hosts (including short links); subdomains such as www. also match
+_AMAZON_HOSTS = frozenset({
+    'amazon.com', 'amazon.in', 'amazon.co.uk', 'amazon.de',
+    'amzn.in', 'amzn.to', 'a.co'  # Amazon short URLs
+})
+_AMAZON_HOST_SUFFIXES = tuple(f".{host}" for host in _AMAZON_HOSTS)
+
+def is_amazon_url(url: str) -> bool:
+    """Check if URL is from Amazon (including short links)"""
+    # Accept scheme-less input like "amzn.in/d/xyz" by parsing it as a netloc
+    try:
+        host = urlsplit(url if "//" in url else f"//{url}").hostname
+    except ValueError:
+        # Malformed netloc, e.g. an unterminated IPv6 bracket ("http://[abc")
+        return False
+    if not host:
+        return False
+    return host in _AMAZON_HOSTS or host.endswith(_AMAZON_HOST_SUFFIXES)
+
 def setup_logging():
     """Setup logging configuration"""
+    from loguru import logger
+    
     logger.remove()
     logger.add(
         sys.stdout,
@@ -28,11 +55,37 @@ def setup_logging():
         f"{settings.LOG_DIR}/scraper.log",
         rotation="10 MB",
         level="DEBUG",
+        enqueue=True,  # format/write on loguru's background thread
+        buffering=65536,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
     )
 
+def save_result(result: dict):
+    """Save a scraped product as JSON (everything) and CSV (reviews)"""
+    from scraper.utils import save_to_json, save_reviews_to_csv, generate_filename
+    
+    product_name = result["product_details"].get("name", "unknown_product")
+    asin = result["product_details"].get("asin", "unknown_asin")
+    
+    # JSON and CSV outputs are independent, so write them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Save complete data as JSON
+        json_filename = generate_filename(product_name, asin, "json")
+        futures = [executor.submit(save_to_json, result, json_filename)]
+        
+        # Save reviews as CSV
+        if result["reviews"]:
+            csv_filename = generate_filename(product_name, asin, "csv")
+            futures.append(executor.submit(save_reviews_to_csv, result["reviews"], csv_filename))
+        
+        for future in futures:
+            future.result()
+
 def scrape_amazon_product(url: str, save_files: bool = True) -> dict:
     """Scrape Amazon product with all details and reviews"""
+    from loguru import logger
+    from scraper.amazon_scraper import AmazonScraper
+    from scraper.utils import print_scraping_summary
     
     logger.info("🛍️ E-Commerce Web Scraper Starting...")
     logger.info(f"🔗 Target URL: {url}")
@@ -45,18 +98,7 @@ def scrape_amazon_product(url: str, save_files: bool = True) -> dict:
             result = scraper.scrape_product(url)
             
             if save_files:
-                # Save complete data
-                product_name = result["product_details"].get("name", "unknown_product")
-                asin = result["product_details"].get("asin", "unknown_asin")
-                
-                # Save complete data as JSON
-                json_filename = generate_filename(product_name, asin, "json")
-                save_to_json(result, json_filename)
-                
-                # Save reviews as CSV
-                if result["reviews"]:
-                    csv_filename = generate_filename(product_name, asin, "csv")
-                    save_reviews_to_csv(result["reviews"], csv_filename)
+                save_result(result)
             
             # Print summary
             print_scraping_summary(result)
@@ -70,16 +112,74 @@ def scrape_amazon_product(url: str, save_files: bool = True) -> dict:
         logger.error(f"❌ Scraping failed: {e}")
         return {}
 
-def main():
-    """Main function with CLI interface"""
+def scrape_amazon_products(urls: List[str], save_files: bool = True, max_concurrency: int = 5) -> List[dict]:
+    """Scrape several Amazon products in parallel browser worker processes"""
+    from loguru import logger
+    from scraper.pool import scrape_urls
+    from scraper.utils import print_scraping_summary
+    
+    logger.info("🛍️ E-Commerce Web Scraper Starting...")
+    logger.info(f"🔗 Target URLs: {len(urls)}")
+    logger.info(f"⚙️ Max Reviews: {settings.MAX_REVIEWS_PER_PRODUCT}")
+    logger.info(f"📄 Max Pages: {settings.MAX_PAGES_TO_SCRAPE}")
+    
+    try:
+        results = scrape_urls(urls, max_concurrency=max_concurrency)
+    except KeyboardInterrupt:
+        logger.info("⚠️ Scraping interrupted by user")
+        return []
+    
+    for result in results:
+        # Failed URLs come back as {"url", "error"} and were logged by the worker
+        if "error" in result:
+            continue
+        if save_files:
+            save_result(result)
+        print_scraping_summary(result)
+    
+    return results
+
+def _worker_count(value: str) -> int:
+    """argparse type for --workers: a positive integer"""
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        import argparse
+        raise argparse.ArgumentTypeError(f"must be a positive integer (got {value!r})")
+    return count
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """Parse CLI arguments, skipping argparse for the common `url [flags]` form"""
+    positional = [arg for arg in argv if not arg.startswith("-")]
+    flags = {arg for arg in argv if arg.startswith("-")}
+    
+    if len(positional) == 1 and flags <= _SIMPLE_FLAGS:
+        return SimpleNamespace(
+            urls=positional,
+            no_save="--no-save" in flags,
+            headless="--headless" in flags,
+            workers=5
+        )
+    
+    # Anything else (--help, several URLs, --workers, missing URL) goes through argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="E-Commerce Web Scraper - Extract product details and reviews"
     )
-    parser.add_argument("url", help="Amazon product URL to scrape")
+    parser.add_argument("urls", nargs="+", metavar="url", help="Amazon product URL(s) to scrape")
     parser.add_argument("--no-save", action="store_true", help="Don't save files")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
+    parser.add_argument("--workers", type=_worker_count, default=5,
+                        help="Parallel browser processes when scraping several URLs (default: 5)")
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+def main():
+    """Main function with CLI interface"""
+    args = parse_args(sys.argv[1:])
     
     # Override settings if needed
     if args.headless:
@@ -87,22 +187,24 @@ def main():
     
     setup_logging()
     
-    def is_amazon_url(url: str) -> bool:
-        """Check if URL is from Amazon (including short links)"""
-        amazon_domains = [
-            'amazon.com', 'amazon.in', 'amazon.co.uk', 'amazon.de',
-            'amzn.in', 'amzn.to', 'a.co'  # Amazon short URLs
-        ]
-        return any(domain in url.lower() for domain in amazon_domains)
-
-    # Use the function
-    if not is_amazon_url(args.url):
-        logger.error("❌ Please provide a valid Amazon product URL")
+    from loguru import logger
+    
+    invalid = [url for url in args.urls if not is_amazon_url(url)]
+    if invalid:
+        logger.error(f"❌ Please provide valid Amazon product URLs (got: {', '.join(invalid)})")
         sys.exit(1)
-
+    
+    # Several URLs fan out over worker processes
+    if len(args.urls) > 1:
+        results = scrape_amazon_products(args.urls, save_files=not args.no_save, max_concurrency=args.workers)
+        if results and all(result.get("reviews") for result in results):
+            logger.info("✅ Scraping completed successfully!")
+            return True
+        logger.error("❌ Scraping failed or no data collected for some URLs")
+        return False
     
     # Start scraping
-    result = scrape_amazon_product(args.url, save_files=not args.no_save)
+    result = scrape_amazon_product(args.urls[0], save_files=not args.no_save)
     
     if result and result.get("reviews"):
         logger.info("✅ Scraping completed successfully!")
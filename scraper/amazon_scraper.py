@@ -1,13 +1,144 @@
 import re
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin
+from dataclasses import asdict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from urllib.parse import urljoin, urlparse
+import requests
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 from selenium.webdriver.common.by import By
 from loguru import logger
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .base_scraper import BaseScraper
+from .models import Review
 from config.settings import settings
 
+# Compiled XPath selectors for ASIN extraction from page HTML
+_META_PAGE_ID = etree.XPath("//meta[@name='pageId']/@content")
+_DATA_ASIN = etree.XPath("(//*[@data-asin])[1]/@data-asin")
+# Only scripts that mention an ASIN; the filter runs inside libxml2
+_ASIN_SCRIPT_TEXTS = etree.XPath("//script[contains(., 'ASIN') or contains(., 'asin')]/text()")
+_ASIN_INPUT = etree.XPath("(//input[@name='ASIN'])[1]/@value")
+# Product image sources only, capped so tracker/thumbnail-heavy pages stay cheap
+_IMG_SRCS = etree.XPath("(//img[contains(@src, '/images/I/')])[position() <= 20]/@src")
+
+# Reads every review on the current page in one WebDriver round-trip
+_JS_EXTRACT_REVIEWS = """
+const text = e => e ? e.textContent.trim() : '';
+return Array.from(document.querySelectorAll("[data-hook='review']")).map(e => ({
+    id: e.id || '',
+    reviewer: text(e.querySelector('.a-profile-name')),
+    rating_text: text(e.querySelector('i.a-icon span.a-icon-alt')),
+    title: text(Array.from(e.querySelectorAll("[data-hook='review-title'] span"))
+        .find(s => !s.closest('i') && s.textContent.trim())),
+    body: text(e.querySelector("[data-hook='review-body'] span")),
+    date: text(e.querySelector("[data-hook='review-date']")),
+    verified: !!e.querySelector("[data-hook='avp-badge']"),
+    helpful: text(e.querySelector("[data-hook='helpful-vote-statement']")),
+    vine: !!e.querySelector("[data-hook='vine-customer-review']")
+}));
+"""
+
+# Compiled XPath selectors for reviews pages fetched over HTTP
+_REVIEW_BLOCKS = etree.XPath("//*[@data-hook='review']")
+_REVIEWER_NAME = etree.XPath("string(.//span[contains(concat(' ', normalize-space(@class), ' '), ' a-profile-name ')])")
+_REVIEW_RATING = etree.XPath(
+    "string(.//i[contains(concat(' ', normalize-space(@class), ' '), ' a-icon ')]"
+    "//span[contains(concat(' ', normalize-space(@class), ' '), ' a-icon-alt ')])"
+)
+# Skips the star-rating text that Amazon nests inside the title link
+_REVIEW_TITLE = etree.XPath("string((.//*[@data-hook='review-title']//span[not(ancestor::i)][normalize-space()])[1])")
+_REVIEW_BODY = etree.XPath("string(.//*[@data-hook='review-body']//span)")
+_REVIEW_DATE = etree.XPath("string(.//*[@data-hook='review-date'])")
+_REVIEW_VERIFIED = etree.XPath("boolean(.//*[@data-hook='avp-badge'])")
+_REVIEW_HELPFUL = etree.XPath("string(.//*[@data-hook='helpful-vote-statement'])")
+_REVIEW_VINE = etree.XPath("boolean(.//*[@data-hook='vine-customer-review'])")
+
+# Markers of a bot-check page instead of real product/review HTML (lower-case)
+_BOT_CHECK_MARKERS = ("/errors/validatecaptcha", "api-services-support@amazon.com")
+_SIGNIN_PATH = "/ap/signin"
+
+class _PriceCharTable(dict):
+    """str.translate table keeping decimal digits and '.', deleting everything else"""
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Same characters as the regex [^\d.] kept; filled in lazily per codepoint
+        value = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = value
+        return value
+
+_PRICE_TABLE = _PriceCharTable({ord('.'): ord('.')})
+
+# Currency symbol -> ISO code
+_CURRENCY_MAP = {'$': 'USD', '₹': 'INR', '£': 'GBP', '€': 'EUR'}
+
+# Amazon storefront base URL per domain, checked in order
+_DOMAIN_MAP = {
+    'amazon.com': 'https://www.amazon.com',
+    'amazon.co.uk': 'https://www.amazon.co.uk',
+    'amazon.in': 'https://www.amazon.in',
+    'amazon.de': 'https://www.amazon.de'
+}
+
+@lru_cache(maxsize=32)
+def _domain_for_netloc(netloc: str) -> str:
+    """Map a URL netloc to its Amazon storefront base URL"""
+    return next((base for domain, base in _DOMAIN_MAP.items() if domain in netloc), 'https://www.amazon.com')
+
+# Amazon link shorteners; only these need a redirect probe
+_SHORT_HOSTS = frozenset({"a.co", "amzn.to", "amzn.in", "amzn.eu", "amzn.asia"})
+
+# Default headers for the shared HTTP session (User-Agent is copied from the browser)
+_HTTP_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+# Precompiled regex patterns
+_ASIN_URL = re.compile(r'(?:/dp/|/gp/product/|[?&]asin=)([A-Z0-9]{10})')
+_PRODUCT_PATH = re.compile(r'/(?:dp|gp/product)/[A-Z0-9]{10}')
+# "ASIN": "...", "asin": "...", asin: "..." and ASIN = "..." in a single scan
+_JS_ASIN = re.compile(r'(?:"ASIN"\s*:|"asin"\s*:|asin\s*:|ASIN\s*=)\s*"([A-Z0-9]{10})"')
+_IMG_ASIN = re.compile(r'/([A-Z0-9]{10})\.')
+_RATING = re.compile(r'(\d+\.?\d*)')
+_COUNT = re.compile(r'([\d,]+)')
+_INTEGER = re.compile(r'(\d+)')
+_BULLET_LEADER = re.compile(r'^[•\-\*]\s*')
+
+# Reads every product field in one WebDriver round-trip. arguments[0] maps each
+# field to its selector list; single-value fields return the first match's text
+# per selector (null when absent), list fields return up to `limit` values from
+# the first selector that matches anything.
+_JS_EXTRACT_ALL = """
+const sel = arguments[0];
+const text = e => (e.innerText || e.textContent || '').trim();
+const firstPerSelector = (list, read) => list.map(s => {
+    const e = document.querySelector(s);
+    return e ? read(e) : null;
+});
+const fromFirstMatch = (list, limit, read) => {
+    for (const s of list) {
+        const els = document.querySelectorAll(s);
+        if (els.length) return Array.from(els).slice(0, limit).map(read);
+    }
+    return [];
+};
+return {
+    name: firstPerSelector(sel.name, text),
+    price: firstPerSelector(sel.price, text),
+    rating: firstPerSelector(sel.rating, e => (e.textContent || '').trim()),
+    review_count: firstPerSelector(sel.review_count, text),
+    // Same length/prefix rule as _extract_features, applied before the texts leave the browser
+    features: fromFirstMatch(sel.features, 10, text)
+        .filter(t => t.length > 10 && !t.startsWith('Make sure')),
+    seller: firstPerSelector(sel.seller, text),
+    availability: firstPerSelector(sel.availability, text),
+    images: fromFirstMatch(sel.images, 5, e => e.src || '')
+};
+"""
+
 class AmazonScraper(BaseScraper):
     """
     Amazon scraper implementing presentation specifications:
@@ -15,78 +146,160 @@ class AmazonScraper(BaseScraper):
     📝 Collects customer reviews: Review text and ratings, reviewer metadata, verified purchase status
     """
     
+    # CSS selectors per product field, in priority order
+    FIELD_SELECTORS = {
+        "name": [
+            "#productTitle",
+            ".product-title h1",
+            "h1.a-size-large"
+        ],
+        "price": [
+            ".a-price-whole",
+            ".a-offscreen",
+            "#apex_desktop .a-price .a-offscreen",
+            "#price_inside_buybox",
+            ".a-price .a-offscreen"
+        ],
+        "rating": [
+            ".a-icon-alt",
+            "[data-hook='average-star-rating'] .a-icon-alt",
+            ".reviewCountTextLinkedHistogram .a-icon-alt"
+        ],
+        "review_count": [
+            "#acrCustomerReviewText",
+            "[data-hook='total-review-count']",
+            ".reviewCountTextLinkedHistogram .a-link-normal"
+        ],
+        "features": [
+            "#feature-bullets ul li",
+            "#productDetails_feature_div li",
+            ".a-unordered-list .a-list-item"
+        ],
+        "seller": [
+            "#sellerProfileTriggerId",
+            "#bylineInfo",
+            ".po-brand .po-break-word"
+        ],
+        "availability": [
+            "#availability span",
+            ".a-color-success",
+            ".a-color-price"
+        ],
+        "images": [
+            "#altImages img",
+            "#landingImage",
+            ".a-dynamic-image"
+        ]
+    }
+    
+    # Same selectors joined into one CSS union per field, so a locator lookup
+    # costs a single driver round-trip (matches come back in document order)
+    FIELD_SELECTOR_UNIONS = {field: ", ".join(selectors) for field, selectors in FIELD_SELECTORS.items()}
+    
+    # Same selectors compiled for lxml, used when the page was fetched without the browser
+    FIELD_CSS = {field: [CSSSelector(selector) for selector in selectors] for field, selectors in FIELD_SELECTORS.items()}
+    
+    # Product pages that already contain the title were rendered server-side
+    static_marker = 'id="productTitle"'
+    bot_check_markers = _BOT_CHECK_MARKERS
+    
     def __init__(self):
         super().__init__()
         self.base_url = ""
+        
+        # Parsed HTML of the current page, reused until the next navigation
+        self._cached_tree = None
+        
+        # The shared HTTP session should look like the same client as the browser
+        self._http.headers.update(_HTTP_HEADERS)
+        self._http.headers["User-Agent"] = self._browser_user_agent()
     
     def detect_amazon_domain(self, url: str) -> str:
         """Detect Amazon domain from URL"""
-        if 'amazon.com' in url:
-            return 'https://www.amazon.com'
-        elif 'amazon.co.uk' in url:
-            return 'https://www.amazon.co.uk'
-        elif 'amazon.in' in url:
-            return 'https://www.amazon.in'
-        elif 'amazon.de' in url:
-            return 'https://www.amazon.de'
-        else:
-            return 'https://www.amazon.com'
+        return _domain_for_netloc(urlparse(url).netloc.lower())
     
     def extract_asin(self, url: str) -> Optional[str]:
         """Extract ASIN from URL or page source"""
-        # First try URL patterns
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'/gp/product/([A-Z0-9]{10})',
-            r'asin=([A-Z0-9]{10})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        # First try URL patterns (/dp/, /gp/product/, asin= query parameter)
+        match = _ASIN_URL.search(url)
+        if match:
+            return match.group(1)
         
         # If not found in URL, extract from page source
         return self.extract_asin_from_page()
 
     def extract_asin_from_page(self) -> Optional[str]:
-        """Extract ASIN from loaded page HTML"""
+        """Extract ASIN from the loaded page - handles short URLs"""
         try:
-            from bs4 import BeautifulSoup
+            # Methods run cheapest first, so the script scan is only reached when
+            # nothing else on the page carries the ASIN
+            tree = self._page_tree()
             
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Try multiple methods to find ASIN
-            # Method 1: Meta tag
-            asin_meta = soup.find('meta', {'name': 'pageId'})
-            if asin_meta:
-                return asin_meta.get('content')
+            # Method 1: URL patterns (no HTML scan); a page fetched without the
+            # browser carries its own URL, the driver may still be on another page
+            asin_match = _ASIN_URL.search(tree.base_url or self.driver.current_url)
+            if asin_match:
+                return asin_match.group(1)
             
             # Method 2: Data attributes
-            asin_element = soup.find(attrs={'data-asin': True})
+            asin_element = _DATA_ASIN(tree)
             if asin_element:
-                return asin_element.get('data-asin')
+                asin = asin_element[0]
+                if asin and len(asin) == 10:
+                    return asin
+            
+            # Method 3: Meta tag with pageId
+            meta_content = _META_PAGE_ID(tree)
+            if meta_content:
+                content = meta_content[0]
+                if len(content) == 10 and content.isalnum():
+                    return content
+            
+            # Method 4: Form inputs with ASIN
+            asin_input = _ASIN_INPUT(tree)
+            if asin_input:
+                asin = asin_input[0]
+                if asin and len(asin) == 10:
+                    return asin
             
-            # Method 3: JavaScript variables (look for ASIN in script tags)
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string:
-                    asin_match = re.search(r'"ASIN"\s*:\s*"([A-Z0-9]{10})"', script.string)
-                    if asin_match:
-                        return asin_match.group(1)
+            # Method 5: JavaScript variables in script tags
+            for script_text in _ASIN_SCRIPT_TEXTS(tree):
+                # Look for ASIN in various JS patterns
+                match = _JS_ASIN.search(script_text)
+                if match:
+                    return match.group(1)
             
+            # Method 6: Look in image URLs
+            for src in _IMG_SRCS(tree):
+                # Amazon product images often contain ASIN-like patterns
+                match = _IMG_ASIN.search(src)
+                if match:
+                    return match.group(1)
+            
+            logger.warning("⚠️ Could not extract ASIN from page")
             return None
             
         except Exception as e:
-            logger.debug(f"Error extracting ASIN from page: {e}")
+            logger.error(f"❌ Error extracting ASIN from page: {e}")
             return None
 
+    def _page_tree(self):
+        """Parse the current page HTML once; cleared whenever the driver navigates"""
+        if self._cached_tree is None:
+            self._cached_tree = lxml.html.fromstring(self.get_page_html())
+        return self._cached_tree
+
     def resolve_short_url(self, url: str) -> str:
         """Resolve shortened Amazon URLs to full URLs"""
+        # Full product URLs and non-shortener hosts need no network round-trip
+        if _PRODUCT_PATH.search(url):
+            return url
+        host = (urlparse(url).hostname or "").removeprefix("www.")
+        if host not in _SHORT_HOSTS:
+            return url
+        
         try:
-            import requests
-            response = requests.head(url, allow_redirects=True, timeout=10)
+            response = self._http.head(url, allow_redirects=True, timeout=10)
             final_url = response.url
             logger.info(f"🔗 Resolved URL: {final_url}")
             return final_url
@@ -125,44 +338,49 @@ class AmazonScraper(BaseScraper):
             base_url = self.detect_amazon_domain(resolved_url)
             
             logger.info(f"🌐 Navigating to: {resolved_url}")
-            self.driver.get(resolved_url)
+            self._cached_tree = None
+            static_html = self.fetch_static_page(resolved_url)
+            if static_html is not None:
+                # Server-rendered page: parse it directly, the browser stays idle
+                self._cached_tree = lxml.html.fromstring(static_html, base_url=resolved_url)
+            else:
+                self.driver.get(resolved_url)
             self.ethical_delay()
             
             # Extract ASIN from page source (fixes short URL issue)
             product_data["asin"] = self.extract_asin_from_page() or ""
             logger.info(f"📦 ASIN: {product_data['asin']}")
             
+            # Raw field values, read in one pass from the parsed HTML or the browser
+            if static_html is not None:
+                fields = self._collect_static_fields(self._cached_tree)
+            else:
+                fields = self._collect_page_fields()
+            
             # Product name
-            name_selectors = [
-                "#productTitle",
-                ".product-title h1",
-                "h1.a-size-large"
-            ]
-            
-            for selector in name_selectors:
-                element = self.safe_find_element(By.CSS_SELECTOR, selector)
-                if element:
-                    product_data["name"] = self.safe_get_text(element)
+            for name_text in fields["name"]:
+                if name_text is not None:
+                    product_data["name"] = name_text
                     logger.info(f"📝 Product: {product_data['name'][:50]}...")
                     break
             
             # Price extraction
-            self._extract_price_info(product_data)
+            self._extract_price_info(product_data, fields["price"])
             
             # Rating and review count
-            self._extract_rating_info(product_data)
+            self._extract_rating_info(product_data, fields["rating"], fields["review_count"])
             
             # Features
-            self._extract_features(product_data)
+            self._extract_features(product_data, fields["features"])
             
             # Seller information
-            self._extract_seller_info(product_data)
+            self._extract_seller_info(product_data, fields["seller"])
             
             # Availability
-            self._extract_availability(product_data)
+            self._extract_availability(product_data, fields["availability"])
             
             # Product images
-            self._extract_images(product_data)
+            self._extract_images(product_data, fields["images"])
             
             logging_summary = f"""
             ✅ Product Details Extracted:
@@ -180,246 +398,124 @@ class AmazonScraper(BaseScraper):
         
         return product_data
     
-    def _extract_asin_from_page(self) -> Optional[str]:
-        """
-        Extract ASIN from loaded page HTML - handles short URLs
-        """
+    def _collect_page_fields(self) -> Dict[str, Any]:
+        """Read raw product field values from the current page in a single script call"""
         try:
-            from bs4 import BeautifulSoup
-            
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Method 1: Try URL patterns first
-            current_url = self.driver.current_url
-            asin_match = re.search(r'/dp/([A-Z0-9]{10})', current_url)
-            if asin_match:
-                return asin_match.group(1)
-            
-            # Method 2: Meta tag with pageId
-            meta_tag = soup.find('meta', {'name': 'pageId'})
-            if meta_tag:
-                content = meta_tag.get('content', '')
-                if len(content) == 10 and content.isalnum():
-                    return content
-            
-            # Method 3: Data attributes
-            asin_element = soup.find(attrs={'data-asin': True})
-            if asin_element:
-                asin = asin_element.get('data-asin')
-                if asin and len(asin) == 10:
-                    return asin
-            
-            # Method 4: JavaScript variables in script tags
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string:
-                    # Look for ASIN in various JS patterns
-                    patterns = [
-                        r'"ASIN"\s*:\s*"([A-Z0-9]{10})"',
-                        r'asin\s*:\s*"([A-Z0-9]{10})"',
-                        r'"asin"\s*:\s*"([A-Z0-9]{10})"',
-                        r'ASIN\s*=\s*"([A-Z0-9]{10})"'
-                    ]
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, script.string)
-                        if match:
-                            return match.group(1)
-            
-            # Method 5: Form inputs with ASIN
-            asin_input = soup.find('input', attrs={'name': 'ASIN'})
-            if asin_input:
-                asin = asin_input.get('value')
-                if asin and len(asin) == 10:
-                    return asin
-            
-            # Method 6: Look in image URLs
-            images = soup.find_all('img')
-            for img in images:
-                src = img.get('src', '')
-                if '/images/I/' in src:
-                    # Amazon product images often contain ASIN-like patterns
-                    match = re.search(r'/([A-Z0-9]{10})\.', src)
-                    if match:
-                        return match.group(1)
-            
-            logger.warning("⚠️ Could not extract ASIN from page")
-            return None
-            
+            fields = self.driver.execute_script(_JS_EXTRACT_ALL, self.FIELD_SELECTORS)
+            if fields:
+                return fields
         except Exception as e:
-            logger.error(f"❌ Error extracting ASIN from page: {e}")
-            return None
+            logger.debug(f"In-browser field extraction failed, using locators: {e}")
         
+        return self._collect_fields_with_locators()
     
+    def _collect_static_fields(self, tree) -> Dict[str, Any]:
+        """Same field values as _JS_EXTRACT_ALL, read from an lxml tree"""
+        css = self.FIELD_CSS
+        
+        def text(element) -> str:
+            return element.text_content().strip()
+        
+        def src(element) -> str:
+            # Absolute, like the browser's img.src
+            value = element.get("src")
+            return urljoin(tree.base_url or "", value) if value else ""
+        
+        def first_per_selector(field: str) -> List[Optional[str]]:
+            values = []
+            for selector in css[field]:
+                matches = selector(tree)
+                values.append(text(matches[0]) if matches else None)
+            return values
+        
+        def from_first_match(field: str, limit: int) -> List[Any]:
+            for selector in css[field]:
+                matches = selector(tree)
+                if matches:
+                    return matches[:limit]
+            return []
+        
+        return {
+            "name": first_per_selector("name"),
+            "price": first_per_selector("price"),
+            "rating": first_per_selector("rating"),
+            "review_count": first_per_selector("review_count"),
+            "features": [
+                feature for feature in map(text, from_first_match("features", 10))
+                if len(feature) > 10 and not feature.startswith("Make sure")
+            ],
+            "seller": first_per_selector("seller"),
+            "availability": first_per_selector("availability"),
+            "images": [src(image) for image in from_first_match("images", 5)]
+        }
     
-    def _extract_price_info(self, product_data: Dict[str, Any]):
+    def _collect_fields_with_locators(self) -> Dict[str, Any]:
+        """Fallback for _collect_page_fields: one compound-selector lookup per field"""
+        unions = self.FIELD_SELECTOR_UNIONS
+        return {
+            "name": self._locator_texts(unions["name"]),
+            "price": self._locator_texts(unions["price"]),
+            "rating": self._locator_texts(unions["rating"], attribute="textContent"),
+            "review_count": self._locator_texts(unions["review_count"]),
+            "features": self._locator_values(unions["features"], limit=10),
+            "seller": self._locator_texts(unions["seller"]),
+            "availability": self._locator_texts(unions["availability"]),
+            "images": self._locator_values(unions["images"], limit=5, attribute="src")
+        }
+    
+    def _locator_texts(self, selector: str, attribute: Optional[str] = None) -> Iterator[str]:
+        """Texts of the elements matching a compound selector (document order), read lazily"""
+        if attribute:
+            return (row[attribute] or row["text"] for row in self.bulk_extract(selector, [attribute]))
+        return (row["text"] for row in self.bulk_extract(selector, []))
+    
+    def _locator_values(self, selector: str, limit: int, attribute: Optional[str] = None) -> List[str]:
+        """Return up to `limit` values from the elements matching a compound selector"""
+        rows = self.bulk_extract(selector, [attribute] if attribute else [], limit=limit)
+        if attribute:
+            return [row[attribute] or "" for row in rows]
+        return [row["text"] for row in rows]
+    
+    def _extract_price_info(self, product_data: Dict[str, Any], price_texts: Iterable[Optional[str]]):
         """Extract price and currency information"""
-        price_selectors = [
-            ".a-price-whole",
-            ".a-offscreen",
-            "#apex_desktop .a-price .a-offscreen",
-            "#price_inside_buybox",
-            ".a-price .a-offscreen"
-        ]
-        
-        for selector in price_selectors:
-            element = self.safe_find_element(By.CSS_SELECTOR, selector)
-            if element:
-                price_text = self.safe_get_text(element)
-                if price_text:
-                    # Extract currency and price
-                    if '$' in price_text:
-                        product_data["currency"] = "USD"
-                        product_data["price"] = re.sub(r'[^\d.]', '', price_text)
-                    elif '₹' in price_text:
-                        product_data["currency"] = "INR"
-                        product_data["price"] = re.sub(r'[^\d.]', '', price_text)
-                    elif '£' in price_text:
-                        product_data["currency"] = "GBP" 
-                        product_data["price"] = re.sub(r'[^\d.]', '', price_text)
-                    elif '€' in price_text:
-                        product_data["currency"] = "EUR"
-                        product_data["price"] = re.sub(r'[^\d.]', '', price_text)
-                    else:
-                        product_data["price"] = re.sub(r'[^\d.]', '', price_text)
+        for price_text in price_texts:
+            if price_text:
+                # Extract currency (first symbol found) and price
+                currency = next((_CURRENCY_MAP[char] for char in price_text if char in _CURRENCY_MAP), None)
+                if currency:
+                    product_data["currency"] = currency
+                product_data["price"] = price_text.translate(_PRICE_TABLE)
                     
-                    logger.info(f"💰 Price: {product_data['currency']} {product_data['price']}")
-                    break
+                logger.info(f"💰 Price: {product_data['currency']} {product_data['price']}")
+                break
     
-    def _extract_rating_info(self, product_data: Dict[str, Any]):
+    def _extract_rating_info(
+        self,
+        product_data: Dict[str, Any],
+        rating_texts: Iterable[Optional[str]],
+        count_texts: Iterable[Optional[str]]
+    ):
         """Extract rating and review count"""
         # Rating
-        rating_selectors = [
-            ".a-icon-alt",
-            "[data-hook='average-star-rating'] .a-icon-alt",
-            ".reviewCountTextLinkedHistogram .a-icon-alt"
-        ]
-        
-        for selector in rating_selectors:
-            element = self.safe_find_element(By.CSS_SELECTOR, selector)
-            if element:
-                rating_text = self.safe_get_attribute(element, "textContent") or self.safe_get_text(element)
-                if rating_text:
-                    rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                    if rating_match:
-                        product_data["rating"] = float(rating_match.group(1))
-                        break
+        for rating_text in rating_texts:
+            if rating_text:
+                rating_match = _RATING.search(rating_text)
+                if rating_match:
+                    product_data["rating"] = float(rating_match.group(1))
+                    break
         
         # Review count
-        review_count_selectors = [
-            "#acrCustomerReviewText",
-            "[data-hook='total-review-count']",
-            ".reviewCountTextLinkedHistogram .a-link-normal"
-        ]
-        
-        for selector in review_count_selectors:
-            element = self.safe_find_element(By.CSS_SELECTOR, selector)
-            if element:
-                count_text = self.safe_get_text(element)
-                if count_text:
-                    count_match = re.search(r'([\d,]+)', count_text)
-                    if count_match:
-                        try:
-                            product_data["review_count"] = int(count_match.group(1).replace(',', ''))
-                            break
-                        except ValueError:
-                            pass
-        
-        logger.info(f"⭐ Rating: {product_data['rating']}/5 ({product_data['review_count']} reviews)")
-
-    def _extract_reviews_from_page(self) -> List[Dict[str, Any]]:
-        """Extract reviews from current page"""
-        
-        reviews = []
-        
-        try:
-            # Find all review elements
-            review_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-hook='review']")
-            
-            if not review_elements:
-                logger.warning("⚠️ No review elements found on current page")
-                return reviews
-            
-            for element in review_elements:
-                try:
-                    review_data = {}
-                    
-                    # Reviewer name
-                    try:
-                        reviewer_element = element.find_element(By.CSS_SELECTOR, ".a-profile-name")
-                        review_data["reviewer_name"] = self.safe_get_text(reviewer_element)
-                    except:
-                        review_data["reviewer_name"] = "Anonymous"
-                    
-                    # Rating
+        for count_text in count_texts:
+            if count_text:
+                count_match = _COUNT.search(count_text)
+                if count_match:
                     try:
-                        rating_element = element.find_element(By.CSS_SELECTOR, "i.a-icon span.a-icon-alt")
-                        rating_text = self.safe_get_text(rating_element)
-                        rating_match = re.search(r'(\d+)', rating_text)
-                        review_data["rating"] = int(rating_match.group(1)) if rating_match else 0
-                    except:
-                        review_data["rating"] = 0
-                    
-                    # Review title
-                    try:
-                        title_element = element.find_element(By.CSS_SELECTOR, "[data-hook='review-title'] span")
-                        review_data["title"] = self.safe_get_text(title_element)
-                    except:
-                        review_data["title"] = ""
-                    
-                    # Review content
-                    try:
-                        content_element = element.find_element(By.CSS_SELECTOR, "[data-hook='review-body'] span")
-                        review_data["content"] = self.safe_get_text(content_element)
-                    except:
-                        review_data["content"] = ""
-                    
-                    # Review date
-                    try:
-                        date_element = element.find_element(By.CSS_SELECTOR, "[data-hook='review-date']")
-                        review_data["date"] = self.safe_get_text(date_element)
-                    except:
-                        review_data["date"] = ""
-                    
-                    # Verified purchase status
-                    try:
-                        verified_elements = element.find_elements(By.CSS_SELECTOR, "[data-hook='avp-badge']")
-                        review_data["verified_purchase"] = len(verified_elements) > 0
-                    except:
-                        review_data["verified_purchase"] = False
-                    
-                    # Helpful votes
-                    try:
-                        helpful_element = element.find_elements(By.CSS_SELECTOR, "[data-hook='helpful-vote-statement']")
-                        if helpful_element:
-                            helpful_text = self.safe_get_text(helpful_element[0])
-                            helpful_match = re.search(r'(\d+)', helpful_text)
-                            review_data["helpful_votes"] = int(helpful_match.group(1)) if helpful_match else 0
-                        else:
-                            review_data["helpful_votes"] = 0
-                    except:
-                        review_data["helpful_votes"] = 0
-                    
-                    # Vine customer
-                    try:
-                        vine_elements = element.find_elements(By.CSS_SELECTOR, "[data-hook='vine-customer-review']")
-                        review_data["vine_customer"] = len(vine_elements) > 0
-                    except:
-                        review_data["vine_customer"] = False
-                    
-                    # Only add review if it has meaningful content
-                    if review_data["content"] and len(review_data["content"].strip()) >= 10:
-                        reviews.append(review_data)
-                    
-                except Exception as e:
-                    logger.debug(f"❌ Error parsing individual review: {e}")
-                    continue
-            
-        except Exception as e:
-            logger.error(f"❌ Error extracting reviews from page: {e}")
+                        product_data["review_count"] = int(count_match.group(1).replace(',', ''))
+                        break
+                    except ValueError:
+                        pass
         
-        return reviews
+        logger.info(f"⭐ Rating: {product_data['rating']}/5 ({product_data['review_count']} reviews)")
 
     def wait_for_reviews_to_load(self):
         """Wait for review elements to load"""
@@ -427,8 +523,9 @@ class AmazonScraper(BaseScraper):
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
             
-            # Wait up to 20 seconds for review elements to appear
-            WebDriverWait(self.driver, 20).until(
+            # Wait up to 20 seconds for review elements to appear, polling every
+            # 50 ms instead of the default 500 ms so we return as soon as they render
+            WebDriverWait(self.driver, 20, poll_frequency=0.05).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "[data-hook='review']"))
             )
             logger.info("✅ Reviews loaded successfully")
@@ -438,44 +535,24 @@ class AmazonScraper(BaseScraper):
             return False
 
     
-    def _extract_features(self, product_data: Dict[str, Any]):
+    def _extract_features(self, product_data: Dict[str, Any], feature_texts: List[str]):
         """Extract product features"""
-        feature_selectors = [
-            "#feature-bullets ul li",
-            "#productDetails_feature_div li",
-            ".a-unordered-list .a-list-item"
-        ]
-        
-        for selector in feature_selectors:
-            elements = self.safe_find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                for element in elements[:10]:  # Limit to 10 features
-                    feature_text = self.safe_get_text(element)
-                    if feature_text and len(feature_text) > 10 and not feature_text.startswith("Make sure"):
-                        # Clean the feature text
-                        feature_text = re.sub(r'^[•\-\*]\s*', '', feature_text)
-                        product_data["features"].append(feature_text.strip())
-                break
+        for feature_text in feature_texts[:10]:  # Limit to 10 features
+            if feature_text and len(feature_text) > 10 and not feature_text.startswith("Make sure"):
+                # Clean the feature text
+                feature_text = _BULLET_LEADER.sub('', feature_text)
+                product_data["features"].append(feature_text.strip())
         
         logger.info(f"📋 Features extracted: {len(product_data['features'])}")
     
-    def _extract_seller_info(self, product_data: Dict[str, Any]):
+    def _extract_seller_info(self, product_data: Dict[str, Any], seller_texts: Iterable[Optional[str]]):
         """Extract seller information"""
-        seller_selectors = [
-            "#sellerProfileTriggerId",
-            "#bylineInfo",
-            ".po-brand .po-break-word"
-        ]
-        
         seller_info = {}
         
-        for selector in seller_selectors:
-            element = self.safe_find_element(By.CSS_SELECTOR, selector)
-            if element:
-                seller_text = self.safe_get_text(element)
-                if seller_text and not seller_text.startswith("Visit"):
-                    seller_info["name"] = seller_text.replace("Brand:", "").strip()
-                    break
+        for seller_text in seller_texts:
+            if seller_text and not seller_text.startswith("Visit"):
+                seller_info["name"] = seller_text.replace("Brand:", "").strip()
+                break
         
         if not seller_info.get("name"):
             seller_info["name"] = "Amazon"
@@ -483,88 +560,193 @@ class AmazonScraper(BaseScraper):
         product_data["seller_info"] = seller_info
         logger.info(f"🏪 Seller: {seller_info['name']}")
     
-    def _extract_availability(self, product_data: Dict[str, Any]):
+    def _extract_availability(self, product_data: Dict[str, Any], availability_texts: Iterable[Optional[str]]):
         """Extract availability information"""
-        availability_selectors = [
-            "#availability span",
-            ".a-color-success",
-            ".a-color-price"
-        ]
-        
-        for selector in availability_selectors:
-            element = self.safe_find_element(By.CSS_SELECTOR, selector)
-            if element:
-                availability_text = self.safe_get_text(element)
-                if "stock" in availability_text.lower() or "available" in availability_text.lower():
-                    product_data["availability"] = availability_text
-                    break
+        for availability_text in availability_texts:
+            if availability_text and ("stock" in availability_text.lower() or "available" in availability_text.lower()):
+                product_data["availability"] = availability_text
+                break
     
-    def _extract_images(self, product_data: Dict[str, Any]):
+    def _extract_images(self, product_data: Dict[str, Any], image_srcs: List[str]):
         """Extract product images"""
-        image_selectors = [
-            "#altImages img",
-            "#landingImage",
-            ".a-dynamic-image"
-        ]
-        
-        for selector in image_selectors:
-            elements = self.safe_find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                for element in elements[:5]:  # Limit to 5 images
-                    img_src = self.safe_get_attribute(element, "src")
-                    if img_src and "http" in img_src:
-                        product_data["images"].append(img_src)
-                break
+        for img_src in image_srcs[:5]:  # Limit to 5 images
+            if img_src and "http" in img_src:
+                product_data["images"].append(img_src)
     
 
     def collect_customer_reviews(self, url: str, max_pages: int = 5) -> List[Dict[str, Any]]:
         """Collect customer reviews"""
         
-        reviews = []
+        reviews: List[Review] = []
         
         try:
             asin = self.extract_asin(url)
             if not asin:
                 logger.error("❌ Could not extract ASIN")
-                return reviews
+                return []
             
             base_url = self.detect_amazon_domain(url)
             
             # FIX: Build complete URL with domain
             reviews_url = f"{base_url}/product-reviews/{asin}/ref=cm_cr_dp_d_show_all_btm?reviewerType=all_reviews&sortBy=recent"
             
-            logger.info(f"🌐 Navigating to reviews: {reviews_url}")
-            
-            if not self.navigate_with_retry(reviews_url):
-                logger.error("❌ Failed to navigate to reviews page")
-                return reviews
-            
-            for page in range(1, max_pages + 1):
-                logger.info(f"📄 Scraping page {page}")
-                
-                page_reviews = self._extract_reviews_from_page()
-                reviews.extend(page_reviews)
-                
-                logger.info(f"📝 Found {len(page_reviews)} reviews on page {page}")
-                
-                # Navigate to next page
-                try:
-                    next_button = self.safe_find_element(By.CSS_SELECTOR, "li.a-last a")
-                    if next_button and "a-disabled" not in next_button.get_attribute("class"):
-                        next_button.click()
-                        self.ethical_delay()
-                    else:
-                        break
-                except:
-                    break
+            # Reviews pages are static HTML: try plain HTTP before driving the browser
+            http_reviews = self._collect_reviews_over_http(reviews_url, max_pages)
+            if http_reviews is not None:
+                reviews = http_reviews
+            else:
+                reviews = self._collect_reviews_with_browser(reviews_url, max_pages)
             
         except Exception as e:
             logger.error(f"❌ Error collecting reviews: {e}")
         
         logger.info(f"✅ Total reviews collected: {len(reviews)}")
+        # Records stay slotted objects until here, the serialization boundary
+        return [asdict(review) for review in reviews]
+    
+    def _collect_reviews_with_browser(self, reviews_url: str, max_pages: int) -> List[Review]:
+        """Collect reviews by driving the browser through the review pages"""
+        reviews: List[Review] = []
+        
+        logger.info(f"🌐 Navigating to reviews: {reviews_url}")
+        
+        self._cached_tree = None
+        if not self.navigate_with_retry(reviews_url):
+            logger.error("❌ Failed to navigate to reviews page")
+            return reviews
+        
+        for page in range(1, max_pages + 1):
+            logger.info(f"📄 Scraping page {page}")
+            
+            page_reviews = self._extract_reviews_from_page()
+            reviews.extend(page_reviews)
+            
+            logger.info(f"📝 Found {len(page_reviews)} reviews on page {page}")
+            
+            # Navigate to next page (retried with a fresh lookup if the cached button went stale)
+            if not self._navigate_to_next_page():
+                break
+        
         return reviews
 
-    def _extract_reviews_from_page(self) -> List[Dict[str, Any]]:
+    def _collect_reviews_over_http(self, reviews_url: str, max_pages: int) -> Optional[List[Review]]:
+        """
+        Collect reviews with the shared HTTP session and lxml.
+        Returns None when the first page is blocked or yields no reviews (soft block,
+        markup change) so the caller can fall back to Selenium.
+        """
+        self._sync_browser_session()
+        
+        # First page on its own: it decides between HTTP and the browser fallback
+        logger.info("📄 Fetching reviews page 1 over HTTP")
+        html = self._fetch_reviews_html(f"{reviews_url}&pageNumber=1")
+        if html is None:
+            logger.info("🤖 HTTP reviews fetch blocked, falling back to browser")
+            return None
+        
+        reviews = self._parse_reviews_html(html)
+        logger.info(f"📝 Found {len(reviews)} reviews on page 1")
+        if not reviews:
+            logger.info("🤖 No reviews parsed from HTTP page 1, falling back to browser")
+            return None
+        if max_pages <= 1:
+            return reviews
+        
+        # Remaining pages concurrently; results are merged in page order and
+        # stop at the first page that failed or came back empty
+        pages = list(range(2, max_pages + 1))
+        page_urls = [f"{reviews_url}&pageNumber={page}" for page in pages]
+        workers = min(settings.REVIEW_FETCH_WORKERS, len(pages))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for page, page_reviews in zip(pages, executor.map(self._fetch_reviews_page, page_urls)):
+                logger.info(f"📝 Found {len(page_reviews)} reviews on page {page}")
+                if not page_reviews:
+                    break
+                reviews.extend(page_reviews)
+        
+        return reviews
+    
+    def _fetch_reviews_page(self, url: str) -> List[Review]:
+        """Fetch and parse one reviews page (worker for concurrent fetches)"""
+        # Per-worker jitter instead of a fixed delay between pages
+        self.ethical_delay(0.5, 1.5)
+        
+        html = self._fetch_reviews_html(url)
+        if html is None:
+            return []
+        return self._parse_reviews_html(html)
+    
+    def _browser_user_agent(self) -> str:
+        """User-Agent of the running browser, so HTTP fetches look like the same client"""
+        try:
+            return self.driver.execute_script("return navigator.userAgent")
+        except Exception as e:
+            logger.debug(f"Could not read browser User-Agent: {e}")
+            return requests.utils.default_user_agent()
+    
+    def _sync_browser_session(self):
+        """Copy the browser's cookies into the HTTP session"""
+        try:
+            for cookie in self.driver.get_cookies():
+                self._http.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""))
+        except Exception as e:
+            logger.debug(f"Could not copy browser session: {e}")
+    
+    def _fetch_reviews_html(self, url: str) -> Optional[str]:
+        """Fetch a reviews page, returning None on errors or bot-check pages"""
+        try:
+            response = self._http.get(url, timeout=settings.REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            logger.debug(f"HTTP reviews fetch failed: {e}")
+            return None
+        
+        if response.status_code != 200 or _SIGNIN_PATH in response.url:
+            return None
+        
+        html = response.text
+        if self.is_bot_check_page(html):
+            return None
+        return html
+    
+    def _parse_reviews_html(self, html: str) -> List[Review]:
+        """Parse review blocks out of reviews page HTML"""
+        reviews = []
+        
+        try:
+            tree = lxml.html.fromstring(html)
+        except Exception as e:
+            logger.error(f"❌ Error parsing reviews HTML: {e}")
+            return reviews
+        
+        for block in _REVIEW_BLOCKS(tree):
+            try:
+                rating_match = _INTEGER.search(_REVIEW_RATING(block))
+                helpful_match = _INTEGER.search(_REVIEW_HELPFUL(block))
+                
+                review = Review(
+                    review_id=block.get("id", ""),
+                    reviewer_name=_REVIEWER_NAME(block).strip() or "Anonymous",
+                    rating=int(rating_match.group(1)) if rating_match else 0,
+                    title=_REVIEW_TITLE(block).strip(),
+                    review_text=_REVIEW_BODY(block).strip(),
+                    date=_REVIEW_DATE(block).strip(),
+                    verified_purchase=bool(_REVIEW_VERIFIED(block)),
+                    helpful_votes=int(helpful_match.group(1)) if helpful_match else 0,
+                    vine_customer=bool(_REVIEW_VINE(block))
+                )
+                
+                # Only add review if it has meaningful content
+                if len(review.review_text) >= 10:
+                    reviews.append(review)
+                
+            except Exception as e:
+                logger.debug(f"❌ Error parsing individual review: {e}")
+                continue
+        
+        return reviews
+    
+    def _extract_reviews_from_page(self) -> List[Review]:
         """Extract reviews from current page"""
         
         reviews = []
@@ -575,71 +757,35 @@ class AmazonScraper(BaseScraper):
                 logger.warning("⚠️ Reviews did not load within timeout")
                 return reviews
             
-            # Find all review elements
-            review_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-hook='review']")
-                
-            if not review_elements:
+            # All review fields in one script call instead of ~8 lookups per review
+            raw_reviews = self.driver.execute_script(_JS_EXTRACT_REVIEWS)
+            
+            if not raw_reviews:
                 logger.warning("⚠️ No review elements found on current page")
                 return reviews
             
-            for element in review_elements:
+            for raw in raw_reviews:
                 try:
-                    review_data = {}
-                    
-                    # Review ID
-                    review_data["review_id"] = self.safe_get_attribute(element, "id")
-                    
-                    # Reviewer metadata (per presentation spec)
-                    reviewer_element = self.safe_find_element(By.CSS_SELECTOR, ".a-profile-name")
-                    if reviewer_element:
-                        review_data["reviewer_name"] = self.safe_get_text(reviewer_element)
-                    else:
-                        review_data["reviewer_name"] = "Anonymous"
-                    
-                    # Rating
-                    rating_element = element.find_element(By.CSS_SELECTOR, "i.a-icon span.a-icon-alt")
-                    rating_text = self.safe_get_text(rating_element)
-                    if rating_text:
-                        rating_match = re.search(r'(\d+)', rating_text)
-                        if rating_match:
-                            review_data["rating"] = int(rating_match.group(1))
-                        else:
-                            review_data["rating"] = 0
-                    else:
-                        review_data["rating"] = 0
-                    
-                    # Review title
-                    title_element = element.find_element(By.CSS_SELECTOR, "[data-hook='review-title'] span")
-                    review_data["title"] = self.safe_get_text(title_element)
-                    
-                    # Review text (main content)
-                    content_element = element.find_element(By.CSS_SELECTOR, "[data-hook='review-body'] span")
-                    review_data["review_text"] = self.safe_get_text(content_element)
-                    
-                    # Review date
-                    date_element = element.find_element(By.CSS_SELECTOR, "[data-hook='review-date']")
-                    review_data["date"] = self.safe_get_text(date_element)
-                    
-                    # Verified purchase status (per presentation spec)
-                    verified_element = element.find_elements(By.CSS_SELECTOR, "[data-hook='avp-badge']")
-                    review_data["verified_purchase"] = len(verified_element) > 0
-                    
-                    # Helpful votes
-                    helpful_element = element.find_elements(By.CSS_SELECTOR, "[data-hook='helpful-vote-statement']")
-                    if helpful_element:
-                        helpful_text = self.safe_get_text(helpful_element[0])
-                        helpful_match = re.search(r'(\d+)', helpful_text)
-                        review_data["helpful_votes"] = int(helpful_match.group(1)) if helpful_match else 0
-                    else:
-                        review_data["helpful_votes"] = 0
+                    rating_match = _INTEGER.search(raw["rating_text"])
+                    helpful_match = _INTEGER.search(raw["helpful"])
                     
-                    # Vine customer
-                    vine_element = element.find_elements(By.CSS_SELECTOR, "[data-hook='vine-customer-review']")
-                    review_data["vine_customer"] = len(vine_element) > 0
+                    review = Review(
+                        review_id=raw["id"],
+                        # Reviewer metadata (per presentation spec)
+                        reviewer_name=raw["reviewer"] or "Anonymous",
+                        rating=int(rating_match.group(1)) if rating_match else 0,
+                        title=raw["title"],
+                        review_text=raw["body"],
+                        date=raw["date"],
+                        # Verified purchase status (per presentation spec)
+                        verified_purchase=bool(raw["verified"]),
+                        helpful_votes=int(helpful_match.group(1)) if helpful_match else 0,
+                        vine_customer=bool(raw["vine"])
+                    )
                     
                     # Only add review if it has meaningful content
-                    if review_data["review_text"] and len(review_data["review_text"].strip()) >= 10:
-                        reviews.append(review_data)
+                    if len(review.review_text) >= 10:
+                        reviews.append(review)
                     
                 except Exception as e:
                     logger.debug(f"❌ Error parsing individual review: {e}")
@@ -1,22 +1,313 @@
+import atexit
+import functools
+import itertools
+import queue
+import threading
 import time
 import random
 import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from urllib.parse import urlparse
 
-import undetected_chromedriver as uc
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from fake_useragent import UserAgent
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, WebDriverException, InvalidArgumentException
+)
 from loguru import logger
 
 from config.settings import settings
 
+# Chrome flags every driver gets (anti-detection and stability)
+_BASE_FLAGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-web-security',
+    '--ignore-certificate-errors'
+)
+
+@functools.lru_cache(maxsize=1)
+def _user_agents():
+    """One UserAgent per process, imported and built only when user agents are rotated"""
+    from fake_useragent import UserAgent
+    
+    # fake_useragent parses its browser data file on construction
+    return UserAgent(
+        fallback="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                 "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+    )
+
+# Common CAPTCHA containers, joined into one selector so a check is a single lookup
+_CAPTCHA_SELECTOR = ", ".join([
+    "iframe[src*='captcha']",
+    "iframe[src*='recaptcha']",
+    ".captcha-container",
+    "#captcha",
+    "[data-testid='captcha']",
+    ".g-recaptcha"
+])
+
+# Access denied / blocked page wording, matched case-insensitively in a single
+# scan of page_source (no lowered copy of the page)
+_BLOCKED_INDICATORS = re.compile(
+    "access denied|blocked|captcha|unusual traffic|automated requests",
+    re.IGNORECASE
+)
+
+# Requests the browser never needs to make; image URLs stay readable in the DOM
+_BLOCKED_URL_PATTERNS = (
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    # Analytics and ad beacons hold back readyState without adding content
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+    "*amazon-adsystem*", "*/aan/*"
+)
+
+# True when the page's visible text matches the regex source in arguments[0] (case-insensitive)
+_JS_TEXT_MATCHES = """
+const text = document.body ? document.body.innerText : '';
+return new RegExp(arguments[0], 'i').test(text);
+"""
+
+# Async script: scrolls to the bottom up to arguments[0] times, letting the network
+# settle after each scroll (idle for arguments[1] ms, capped at arguments[2] ms), and
+# stops early once the page height stops growing
+_JS_AUTO_SCROLL = """
+const [maxScrolls, idleMs, stepTimeoutMs, done] = arguments;
+let last = performance.now();
+const observer = new PerformanceObserver(() => { last = performance.now(); });
+observer.observe({entryTypes: ['resource']});
+let height = document.body.scrollHeight;
+let scrolls = 0;
+(function step() {
+    window.scrollTo(0, document.body.scrollHeight);
+    scrolls++;
+    const stepStart = last = performance.now();
+    (function settle() {
+        const now = performance.now();
+        if (now - last < idleMs && now - stepStart < stepTimeoutMs) {
+            setTimeout(settle, 50);
+            return;
+        }
+        const newHeight = document.body.scrollHeight;
+        if (newHeight === height || scrolls >= maxScrolls) {
+            observer.disconnect();
+            done({scrolls: scrolls, height: newHeight});
+        } else {
+            height = newHeight;
+            step();
+        }
+    })();
+})();
+"""
+
+# Reads text plus the requested attributes of every match in one WebDriver
+# round-trip. Like WebElement.get_attribute, DOM properties win over attributes.
+_JS_BULK_EXTRACT = """
+const nodes = Array.from(document.querySelectorAll(arguments[0]));
+return (arguments[2] == null ? nodes : nodes.slice(0, arguments[2])).map(e => {
+    const row = {text: (e.innerText || e.textContent || '').trim()};
+    for (const a of arguments[1]) {
+        const v = a in e ? e[a] : e.getAttribute(a);
+        row[a] = v == null ? null : String(v);
+    }
+    return row;
+});
+"""
+
+def _widen_command_pool(driver, maxsize: int = 20):
+    """
+    Let several driver commands run at once: the WebDriver HTTP client's urllib3
+    pool holds a single keep-alive connection by default
+    """
+    executor = driver.command_executor
+    executor.keep_alive = True
+    if getattr(executor, "_conn", None) is None:
+        executor._conn = executor._get_connection_manager()
+    executor._conn.connection_pool_kw["maxsize"] = maxsize
+    # Pools already opened were sized with the old limit; they reopen on next use
+    executor._conn.clear()
+
+def _build_driver():
+    """Launch a Chrome driver with anti-detection measures"""
+    if settings.USE_UNDETECTED_CHROME:
+        # Only loaded when used; it probes for the Chrome binary on import
+        import undetected_chromedriver as uc
+        options = uc.ChromeOptions()
+        logger.info("Using undetected Chrome driver for anti-bot protection")
+    else:
+        options = Options()
+    
+    # Basic options
+    if settings.HEADLESS:
+        options.add_argument('--headless')
+    
+    # Anti-detection options (per presentation: Anti-bot measures)
+    for flag in _BASE_FLAGS:
+        options.add_argument(flag)
+    options.add_argument(f'--window-size={settings.WINDOW_SIZE}')
+    
+    # Don't download images, stylesheets or fonts; image URLs stay in the DOM `src` attributes
+    if settings.BLOCK_PAGE_RESOURCES:
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.media_stream": 2
+        })
+    
+    # User agent rotation (per presentation: rotating proxies, browser automation)
+    if settings.ROTATE_USER_AGENTS:
+        try:
+            user_agent = _user_agents().random
+            options.add_argument(f'--user-agent={user_agent}')
+            logger.info(f"Using user agent: {user_agent[:50]}...")
+        except:
+            logger.warning("Failed to set random user agent, using default")
+    
+    # Create driver
+    if settings.USE_UNDETECTED_CHROME:
+        driver = uc.Chrome(options=options)
+    else:
+        driver = webdriver.Chrome(options=options)
+    
+    try:
+        _widen_command_pool(driver)
+    except Exception as e:
+        logger.debug(f"Could not resize WebDriver connection pool: {e}")
+    
+    # Drop heavy assets and trackers on the wire (prefs alone still let some through)
+    if settings.BLOCK_PAGE_RESOURCES:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
+            driver.execute_cdp_cmd("Page.setDownloadBehavior", {"behavior": "deny"})
+        except Exception as e:
+            logger.debug(f"CDP resource blocking unavailable: {e}")
+    
+    # Set timeouts; no implicit wait, so absence checks return at once and
+    # explicit WebDriverWaits aren't stretched by it
+    driver.implicitly_wait(0)
+    driver.set_page_load_timeout(settings.REQUEST_TIMEOUT)
+    # Covers the async in-page scroller
+    driver.set_script_timeout(settings.REQUEST_TIMEOUT)
+    
+    logger.info("✅ Chrome driver setup completed successfully")
+    return driver
+
+class ChromeDriverPool:
+    """
+    Keeps warm Chrome drivers for reuse across scrapers:
+    • Drivers are launched lazily, up to `size`
+    • Released drivers are wiped (cookies, page) before reuse
+    • Drivers are quit after `max_uses` releases (scraper sessions) to bound memory growth
+    """
+    
+    def __init__(self, size: int, max_uses: int):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.Queue(maxsize=size)
+        # Releases (scraper sessions) per live driver; guarded by _lock like _launched
+        self._uses: Dict[Any, int] = {}
+        self._launched = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self, timeout: float = None):
+        """Take an idle driver, launching one if the pool isn't full yet"""
+        timeout = settings.DRIVER_ACQUIRE_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        warned = False
+        
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            
+            with self._lock:
+                launch = self._launched < self.size
+                if launch:
+                    self._launched += 1
+            if launch:
+                break
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"No Chrome driver became free within {timeout} seconds "
+                    f"(DRIVER_POOL_SIZE={self.size}; close scrapers you are done with)"
+                )
+            if not warned:
+                logger.warning(f"⏳ All {self.size} pooled drivers are in use, waiting for one to be released...")
+                warned = True
+            
+            # Every driver is busy; wait for a release (or a discard freeing a slot)
+            try:
+                return self._idle.get(timeout=min(1.0, remaining))
+            except queue.Empty:
+                continue
+        
+        try:
+            driver = _build_driver()
+        except Exception:
+            with self._lock:
+                self._launched -= 1
+            raise
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+    
+    def release(self, driver):
+        """Return a driver to the pool, or quit it once it has been used enough"""
+        with self._lock:
+            uses = self._uses.get(driver, 0) + 1
+            self._uses[driver] = uses
+        
+        if uses < self.max_uses:
+            try:
+                # Isolate the next scraper from this one's session
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+                self._idle.put_nowait(driver)
+                logger.debug(f"♻️ Driver returned to pool ({uses}/{self.max_uses} uses)")
+                return
+            except Exception as e:
+                logger.debug(f"Driver reset failed, discarding it: {e}")
+        
+        self._discard(driver)
+    
+    def drain(self):
+        """Quit every idle driver"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+    
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+            self._launched -= 1
+        try:
+            driver.quit()
+            logger.info("🔒 Driver closed successfully")
+        except Exception as e:
+            logger.error(f"❌ Error closing driver: {e}")
+
+_POOL = ChromeDriverPool(settings.DRIVER_POOL_SIZE, settings.MAX_USES_PER_DRIVER)
+atexit.register(_POOL.drain)
+
 class BaseScraper(ABC):
     """
     Base scraper implementing presentation specifications:
@@ -27,64 +318,53 @@ class BaseScraper(ABC):
     • Multiple page pagination
     """
     
+    # Substring that only appears in complete server-rendered HTML of the target
+    # page; subclasses set it to enable fetch_static_page (None disables)
+    static_marker: Optional[str] = None
+    
+    # Lower-case substrings that only appear on the target site's bot-check pages
+    bot_check_markers: Tuple[str, ...] = ()
+    
     def __init__(self):
         self.driver = None
         self.wait = None
-        self.user_agent = UserAgent()
+        
+        # Cleared after the first fetch_static_page miss
+        self._static_fetch_enabled = True
+        
+        # Elements found by safe_find_element on the current page, keyed by (by, value)
+        
+        # Shared HTTP session so non-Selenium fetches reuse keep-alive connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=settings.MAX_RETRIES, backoff_factor=0.3)
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        
         self.setup_driver()
     
     def setup_driver(self):
-        """Setup Chrome driver with anti-detection measures"""
+        """Take a warm Chrome driver from the shared pool"""
         try:
-            if settings.USE_UNDETECTED_CHROME:
-                options = uc.ChromeOptions()
-                logger.info("Using undetected Chrome driver for anti-bot protection")
-            else:
-                options = Options()
-            
-            # Basic options
-            if settings.HEADLESS:
-                options.add_argument('--headless')
-            
-            # Anti-detection options (per presentation: Anti-bot measures)
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-plugins')
-            options.add_argument('--disable-images')  # Faster loading
-            options.add_argument(f'--window-size={settings.WINDOW_SIZE}')
-            options.add_argument('--disable-web-security')
-            options.add_argument('--ignore-certificate-errors')
-            
-            # User agent rotation (per presentation: rotating proxies, browser automation)
-            if settings.ROTATE_USER_AGENTS:
-                try:
-                    user_agent = self.user_agent.random
-                    options.add_argument(f'--user-agent={user_agent}')
-                    logger.info(f"Using user agent: {user_agent[:50]}...")
-                except:
-                    logger.warning("Failed to set random user agent, using default")
-            
-            # Create driver
-            if settings.USE_UNDETECTED_CHROME:
-                self.driver = uc.Chrome(options=options)
-            else:
-                self.driver = webdriver.Chrome(options=options)
-            
-            # Set timeouts
-            self.driver.implicitly_wait(10)
-            self.driver.set_page_load_timeout(settings.REQUEST_TIMEOUT)
+            self.driver = _POOL.acquire()
             
             # WebDriverWait for explicit waits
             self.wait = WebDriverWait(self.driver, settings.REQUEST_TIMEOUT)
             
-            logger.info("✅ Chrome driver setup completed successfully")
-            
         except Exception as e:
             logger.error(f"❌ Failed to setup Chrome driver: {e}")
             raise
     
+    def recycle_driver(self):
+        """Hand the driver back to the pool and take a wiped one (a new browser once it is worn out)"""
+        if self.driver:
+            _POOL.release(self.driver)
+            self.driver = None
+        self.setup_driver()
+    
     def handle_dynamic_content_loading(self, timeout: int = 10):
         """Handle dynamic content loading challenge"""
         try:
@@ -106,43 +386,36 @@ class BaseScraper(ABC):
             return
         
         try:
-            # Check for common CAPTCHA elements
-            captcha_selectors = [
-                "iframe[src*='captcha']",
-                "iframe[src*='recaptcha']", 
-                ".captcha-container",
-                "#captcha",
-                "[data-testid='captcha']",
-                ".g-recaptcha"
-            ]
-            
-            for selector in captcha_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    logger.warning("🤖 CAPTCHA detected! Waiting for manual resolution...")
-                    logger.info("Please solve the CAPTCHA manually in the browser window")
-                    
-                    # Wait longer for manual CAPTCHA resolution
-                    time.sleep(30)
-                    break
+            # Check for common CAPTCHA elements (one lookup for all selectors)
+            if self.driver.find_elements(By.CSS_SELECTOR, _CAPTCHA_SELECTOR):
+                logger.warning("🤖 CAPTCHA detected! Waiting for manual resolution...")
+                logger.info("Please solve the CAPTCHA manually in the browser window")
+                
+                # Wait up to 30 s, returning as soon as the CAPTCHA is gone
+                try:
+                    WebDriverWait(self.driver, 30, poll_frequency=1).until_not(
+                        lambda driver: driver.find_elements(By.CSS_SELECTOR, _CAPTCHA_SELECTOR)
+                    )
+                    logger.info("✅ CAPTCHA cleared")
+                except TimeoutException:
+                    logger.warning("⚠️ CAPTCHA still present after 30 seconds")
             
             # Check for access denied or blocked pages
-            page_text = self.driver.page_source.lower()
-            blocked_indicators = [
-                "access denied",
-                "blocked",
-                "captcha",
-                "unusual traffic",
-                "automated requests"
-            ]
-            
-            if any(indicator in page_text for indicator in blocked_indicators):
+            if self._page_looks_blocked():
                 logger.warning("🚫 Potential blocking detected")
                 self.ethical_delay(5, 10)  # Longer delay
                 
         except Exception as e:
             logger.debug(f"Anti-bot check error: {e}")
     
+    def _page_looks_blocked(self) -> bool:
+        """Scan the visible page text in the browser so only a boolean crosses the wire"""
+        try:
+            return self.driver.execute_script(_JS_TEXT_MATCHES, _BLOCKED_INDICATORS.pattern)
+        except Exception as e:
+            logger.debug(f"In-browser blocked check failed, scanning page_source: {e}")
+            return _BLOCKED_INDICATORS.search(self.driver.page_source) is not None
+    
     def ethical_delay(self, min_delay: float = None, max_delay: float = None):
         """Add ethical delays to prevent rate limiting"""
         if not settings.RANDOM_DELAYS:
@@ -156,23 +429,12 @@ class BaseScraper(ABC):
         time.sleep(delay)
     
     def scroll_page(self, pause_time: float = 1.0, max_scrolls: int = 3):
-        """Scroll page to load dynamic content"""
+        """Scroll page to load dynamic content; the scroll/settle loop runs inside the browser"""
         try:
-            current_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            for i in range(max_scrolls):
-                # Scroll to bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(pause_time)
-                
-                # Check if new content loaded
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == current_height:
-                    break
-                current_height = new_height
-                
-                logger.debug(f"📜 Scroll {i+1}: Page height = {new_height}")
-                
+            # Each scroll settles for up to pause_time, ending early once the network is idle for 500 ms
+            settle_ms = int(pause_time * 1000)
+            result = self.driver.execute_async_script(_JS_AUTO_SCROLL, max_scrolls, min(500, settle_ms), settle_ms)
+            logger.debug(f"📜 Scrolled {result['scrolls']} times: Page height = {result['height']}")
         except Exception as e:
             logger.debug(f"Scrolling error: {e}")
     
@@ -195,6 +457,18 @@ class BaseScraper(ABC):
         except Exception as e:
             logger.debug(f"Page ready check error: {e}")
     
+    def get_page_html(self) -> str:
+        """Get the rendered page HTML via DevTools, falling back to page_source"""
+        try:
+            # depth 0: only the root node id is needed, getOuterHTML serializes the subtree
+            root = self.driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})
+            return self.driver.execute_cdp_cmd(
+                "DOM.getOuterHTML", {"nodeId": root["root"]["nodeId"]}
+            )["outerHTML"]
+        except Exception as e:
+            logger.debug(f"CDP outerHTML failed, using page_source: {e}")
+            return self.driver.page_source
+    
     def safe_find_element(self, by: By, value: str, timeout: int = 10) -> Optional[Any]:
         """Safely find element with timeout"""
         try:
@@ -214,6 +488,28 @@ class BaseScraper(ABC):
         except TimeoutException:
             return []
     
+    def bulk_extract(
+        self, css: str, attrs: List[str], limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Text and attributes of the first `limit` elements matching `css`, in one browser call.
+        Lazy: if the script fails, elements are read one by one only as the caller consumes them.
+        """
+        try:
+            rows = self.driver.execute_script(_JS_BULK_EXTRACT, css, attrs, limit)
+        except Exception as e:
+            logger.debug(f"Bulk extraction failed, reading elements one by one: {e}")
+        else:
+            yield from rows
+            return
+        
+        elements = self.driver.find_elements(By.CSS_SELECTOR, css)
+        for element in itertools.islice(elements, limit):
+            row = {"text": self.safe_get_text(element)}
+            for attr in attrs:
+                row[attr] = element.get_attribute(attr)
+            yield row
+    
     def safe_get_text(self, element: Any) -> str:
         """Safely extract text from element"""
         if not element:
@@ -235,6 +531,42 @@ class BaseScraper(ABC):
         except:
             return ""
     
+    def is_bot_check_page(self, html: str) -> bool:
+        """True when HTML fetched without the browser is a bot-check page (see `bot_check_markers`)"""
+        if not self.bot_check_markers:
+            return False
+        lowered = html.lower()
+        return any(marker in lowered for marker in self.bot_check_markers)
+    
+    def fetch_static_page(self, url: str) -> Optional[str]:
+        """
+        Fetch a page over plain HTTP; None unless it carries `static_marker`.
+        HTTP failures and bot-check pages switch the browser on for the rest of the run.
+        """
+        if not self.static_marker or not self._static_fetch_enabled:
+            return None
+        
+        try:
+            response = self._http.get(url, timeout=settings.REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.info(f"🌐 Static fetch failed ({e}), using the browser from now on")
+            self._static_fetch_enabled = False
+            return None
+        
+        html = response.text
+        if self.is_bot_check_page(html):
+            logger.info("🤖 Static fetch got a bot check, using the browser from now on")
+            self._static_fetch_enabled = False
+            return None
+        
+        if self.static_marker in html:
+            logger.info("⚡ Page is server-rendered, skipping the browser")
+            return html
+        
+        # Client-rendered page: only this one needs the browser
+        return None
+    
     def navigate_with_retry(self, url: str) -> bool:
         """Navigate to URL with retry logic"""
         for attempt in range(settings.MAX_RETRIES):
@@ -251,11 +583,15 @@ class BaseScraper(ABC):
                 logger.info("✅ Successfully navigated to URL")
                 return True
                 
-            except Exception as e:
+            except InvalidArgumentException:
+                # A malformed URL fails the same way every time
+                raise
+            except (TimeoutException, WebDriverException) as e:
                 logger.warning(f"❌ Navigation attempt {attempt + 1} failed: {e}")
                 if attempt < settings.MAX_RETRIES - 1:
-                    wait_time = (attempt + 1) * 2
-                    logger.info(f"⏳ Waiting {wait_time} seconds before retry...")
+                    # Capped exponential backoff with full jitter
+                    wait_time = random.uniform(0, min(30, 2 ** attempt))
+                    logger.info(f"⏳ Waiting {wait_time:.2f} seconds before retry...")
                     time.sleep(wait_time)
                 else:
                     logger.error("❌ All navigation attempts failed")
@@ -284,13 +620,11 @@ class BaseScraper(ABC):
         pass
     
     def close(self):
-        """Close the driver"""
+        """Close the HTTP session and hand the driver back to the shared pool"""
+        self._http.close()
         if self.driver:
-            try:
-                self.driver.quit()
-                logger.info("🔒 Driver closed successfully")
-            except Exception as e:
-                logger.error(f"❌ Error closing driver: {e}")
+            _POOL.release(self.driver)
+            self.driver = None
     
     def __enter__(self):
         return self
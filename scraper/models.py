@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class Review:
+    """
+    A single customer review as per presentation:
+    • Review text and ratings
+    • Reviewer metadata
+    • Verified purchase status
+    """
+    review_id: str
+    reviewer_name: str
+    rating: int
+    title: str
+    review_text: str
+    date: str
+    verified_purchase: bool
+    helpful_votes: int
+    vine_customer: bool
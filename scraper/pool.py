@@ -0,0 +1,72 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.util import Finalize
+from typing import Any, Dict, Iterable, List
+
+from loguru import logger
+
+# One scraper (and browser) per worker process, created by _init_worker
+_scraper = None
+# Shared by all workers: serializes Chrome launches
+_launch_lock = None
+
+def _init_worker(launch_lock):
+    """Create this worker's scraper once; its browser is reused until the driver pool recycles it"""
+    global _scraper, _launch_lock
+    from scraper.amazon_scraper import AmazonScraper
+    
+    # undetected_chromedriver patches a shared chromedriver binary on launch, so start one at a time
+    _launch_lock = launch_lock
+    with launch_lock:
+        _scraper = AmazonScraper()
+    # Worker processes skip atexit handlers, so shut the browser down via a finalizer
+    Finalize(None, _shutdown_worker, exitpriority=10)
+
+def _shutdown_worker():
+    """Hand the scraper's driver back, then quit it: the pool's atexit drain never runs here"""
+    from scraper.base_scraper import _POOL
+    
+    _scraper.close()
+    _POOL.drain()
+
+def _scrape_one(url: str) -> Dict[str, Any]:
+    """Scrape a single URL in the worker, reporting failures instead of raising"""
+    try:
+        return _scraper.scrape_product(url)
+    except Exception as e:
+        logger.error(f"❌ Failed to scrape {url}: {e}")
+        return {"url": url, "error": str(e)}
+    finally:
+        _recycle_driver()
+
+def _recycle_driver():
+    """Start each URL on a wiped driver; the pool relaunches Chrome every MAX_USES_PER_DRIVER URLs"""
+    try:
+        with _launch_lock:
+            _scraper.recycle_driver()
+    except Exception as e:
+        logger.error(f"❌ Failed to recycle the worker's browser: {e}")
+
+def scrape_urls(urls: Iterable[str], max_concurrency: int = 5) -> List[Dict[str, Any]]:
+    """Scrape many product URLs in parallel; results keep the input order"""
+    urls = list(urls)
+    if not urls:
+        return []
+    
+    workers = max(1, min(max_concurrency, len(urls)))
+    logger.info(f"🚀 Scraping {len(urls)} URLs with {workers} workers")
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(multiprocessing.Lock(),)) as executor:
+        try:
+            for result in executor.map(_scrape_one, urls, chunksize=1):
+                results.append(result)
+        except BrokenProcessPool as e:
+            # A worker died (browser launch failure, OOM kill...): report what never finished
+            failed = urls[len(results):]
+            logger.error(f"❌ Worker pool broke, {len(failed)} URLs not scraped: {e}")
+            results.extend({"url": url, "error": f"worker pool broke: {e}"} for url in failed)
+    
+    return results
@@ -1,16 +1,32 @@
-import json
 import csv
-import pandas as pd
+import json
+import re
+from collections import Counter
+import orjson
 from datetime import datetime
 from typing import Dict, Any, List
 from loguru import logger
 
+# Anything but letters, digits, '_', ' ' and '-' (same set as str.isalnum() plus those three)
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w -]+')
+
+def _write_bytes(filepath: str, payload: bytes):
+    """Write an encoded payload straight to the file descriptor (no buffer copy)"""
+    view = memoryview(payload)
+    with open(filepath, 'wb', buffering=0) as f:
+        while view:
+            view = view[f.write(view):]
+
 def save_to_json(data: Dict[str, Any], filename: str, directory: str = "data/raw"):
     """Save data to JSON file"""
     try:
         filepath = f"{directory}/{filename}"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        try:
+            payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects a few exotic values (e.g. ints beyond 64 bits); stdlib json doesn't
+            payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+        _write_bytes(filepath, payload)
         logger.info(f"💾 Data saved to: {filepath}")
         return filepath
     except Exception as e:
@@ -25,8 +41,12 @@ def save_reviews_to_csv(reviews: List[Dict[str, Any]], filename: str, directory:
             return None
         
         filepath = f"{directory}/{filename}"
-        df = pd.DataFrame(reviews)
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        # Columns in first-seen order across all reviews; rows stream straight to disk
+        fieldnames = list(dict.fromkeys(key for review in reviews for key in review))
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(reviews)
         logger.info(f"📊 Reviews saved to CSV: {filepath}")
         return filepath
     except Exception as e:
@@ -36,7 +56,7 @@ def save_reviews_to_csv(reviews: List[Dict[str, Any]], filename: str, directory:
 def generate_filename(product_name: str, asin: str, file_type: str = "json") -> str:
     """Generate safe filename from product data"""
     # Clean product name for filename
-    safe_name = "".join(c for c in product_name if c.isalnum() or c in (' ', '-', '_')).strip()[:50]
+    safe_name = _UNSAFE_FILENAME_CHARS.sub('', product_name).strip()[:50]
     safe_name = safe_name.replace(' ', '_')
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -48,6 +68,18 @@ def print_scraping_summary(data: Dict[str, Any]):
     product = data.get("product_details", {})
     reviews = data.get("reviews", [])
     
+    # Rating distribution, rating sum and verified count in one pass over the reviews
+    rating_counts = Counter()
+    rating_total = 0
+    verified_count = 0
+    for review in reviews:
+        rating = review.get('rating', 0)
+        if rating > 0:
+            rating_counts[rating] += 1
+            rating_total += rating
+        verified_count += bool(review.get('verified_purchase', False))
+    rated_count = sum(rating_counts.values())
+    
     print("\n" + "="*60)
     print("🎯 SCRAPING SUMMARY")
     print("="*60)
@@ -56,22 +88,20 @@ def print_scraping_summary(data: Dict[str, Any]):
     print(f"⭐ Rating: {product.get('rating', 0)}/5")
     print(f"📊 Original Review Count: {product.get('review_count', 0)}")
     print(f"📝 Reviews Scraped: {len(reviews)}")
-    print(f"✅ Verified Purchases: {sum(1 for r in reviews if r.get('verified_purchase', False))}")
+    print(f"✅ Verified Purchases: {verified_count}")
     print(f"🏪 Seller: {product.get('seller_info', {}).get('name', 'N/A')}")
     print(f"📋 Features Found: {len(product.get('features', []))}")
     
-    if reviews:
-        ratings = [r.get('rating', 0) for r in reviews if r.get('rating', 0) > 0]
-        if ratings:
-            avg_rating = sum(ratings) / len(ratings)
-            print(f"📈 Average Scraped Rating: {avg_rating:.2f}")
-            
-            # Rating distribution
-            print("\n📊 Rating Distribution:")
-            for rating in range(1, 6):
-                count = ratings.count(rating)
-                percentage = (count / len(ratings)) * 100 if ratings else 0
-                bar = "█" * int(percentage / 5)
-                print(f"  {rating} ⭐: {count:3d} ({percentage:5.1f}%) {bar}")
+    if rated_count:
+        avg_rating = rating_total / rated_count
+        print(f"📈 Average Scraped Rating: {avg_rating:.2f}")
+        
+        # Rating distribution
+        print("\n📊 Rating Distribution:")
+        for rating in range(1, 6):
+            count = rating_counts[rating]
+            percentage = (count / rated_count) * 100
+            bar = "█" * int(percentage / 5)
+            print(f"  {rating} ⭐: {count:3d} ({percentage:5.1f}%) {bar}")
     
     print("="*60)